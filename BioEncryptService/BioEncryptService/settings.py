@@ -128,11 +128,22 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',  # Use JWT for authentication
+        'bio_encrypt_service.authentication.SharedJWTAuthentication',  # JWT, validated once by ClassMiddleware
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',  # Default permission for all views
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'bio_encrypt_service.renderers.Base64JSONRenderer',  # JSON, ciphertexts as base64 strings
+        'bio_encrypt_service.renderers.FrameRenderer',  # Binary frames, ciphertexts as raw bytes
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+        'bio_encrypt_service.parsers.FrameParser',  # Binary frames, ciphertexts as raw bytes
+    ],
 }
 
 from datetime import timedelta
@@ -197,7 +208,7 @@ HASHING_PARAM = {
     'n_projections': int(os.getenv("HASHING_N_PROJECTIONS", 15)),
 }
 
-ENCRYPTION_CLASSES_DIRECTORY = 'bio_encrypt_service.security'
+ENCRYPTION_CLASSES_DIRECTORY = 'bio_encrypt_service.encryption'
 ENCRYPTION_CLASSES = {
     "CKKS": f'{ENCRYPTION_CLASSES_DIRECTORY}.ckks_strategy.CKKSStrategy',
     "BFV": f'{ENCRYPTION_CLASSES_DIRECTORY}.bfv_strategy.BFVStrategy',
@@ -206,4 +217,43 @@ ENCRYPTION_CLASSES = {
 HASHING_CLASSES_DIRECTORY = 'bio_encrypt_service.hashing'
 HASHING_CLASSES = {
     "LSH": f'{HASHING_CLASSES_DIRECTORY}.lsh_strategy.LSHStrategy',
-}
\ No newline at end of file
+}
+
+# Homomorphic distance modes accepted by the knerast endpoint
+DISTANCE_MODES = ('difference', 'squared_euclidean', 'inner_product')
+DEFAULT_DISTANCE_MODE = os.getenv("DEFAULT_DISTANCE_MODE", "difference")
+# Galleries the knerast endpoint scores: the representative embeddings, one encrypted centroid per identification,
+# or the coarse stage (low-dimensional projections of the embeddings under the user's smaller coarse context)
+GALLERIES = ('embeddings', 'centroids', 'coarse')
+# Scheme of the coarse stage context (a key of ENCRYPTION_CLASSES)
+COARSE_ENCRYPTION_TYPE = os.getenv("COARSE_ENCRYPTION_TYPE", "CKKS")
+
+# Bulk enrollment requests carry many ciphertexts
+DATA_UPLOAD_MAX_MEMORY_SIZE = int(os.getenv("DATA_UPLOAD_MAX_MEMORY_SIZE", 256 * 1024 * 1024))
+
+# Threads used to score the candidates of a query in parallel (1 disables the pool)
+DISTANCE_WORKERS = int(os.getenv("DISTANCE_WORKERS", os.cpu_count() or 1))
+
+# Per-process cache of deserialized gallery ciphertexts
+GALLERY_CACHE = {
+    'max_entries': int(os.getenv("GALLERY_CACHE_MAX_ENTRIES", 10000)),
+    'max_bytes': int(os.getenv("GALLERY_CACHE_MAX_BYTES", 1024 * 1024 * 1024)),
+}
+
+# Per-process cache of the users' encryption and hashing strategy instances
+STRATEGY_CACHE = {
+    'max_entries': int(os.getenv("STRATEGY_CACHE_MAX_ENTRIES", 100)),
+    'max_bytes': int(os.getenv("STRATEGY_CACHE_MAX_BYTES", 512 * 1024 * 1024)),
+    'ttl': float(os.getenv("STRATEGY_CACHE_TTL", 3600)) or None,  # Seconds; 0 disables expiry
+}
+
+# Number of embeddings packed into one ciphertext (block_size * n_dimensions must fit the slot count)
+PACKED_BLOCK_SIZE = int(os.getenv("PACKED_BLOCK_SIZE", 32))
+# Embeddings packed and scored per identification, the first enrolled (0 scores every embedding)
+GALLERY_REPRESENTATIVES = int(os.getenv("GALLERY_REPRESENTATIVES", 4))
+# Multi-probe LSH: most neighbouring bucket keys looked up per hash table for a query
+LSH_MAX_PROBES = int(os.getenv("LSH_MAX_PROBES", 64))
+# Most candidates scored homomorphically per query, the most colliding first (default and upper bound of max_candidates)
+LSH_MAX_CANDIDATES = int(os.getenv("LSH_MAX_CANDIDATES", 256))
+# LSH index write-ahead log: its segments are compacted into the snapshot in the background past this size
+LSH_WAL_COMPACT_BYTES = int(os.getenv("LSH_WAL_COMPACT_BYTES", 4 * 1024 * 1024))